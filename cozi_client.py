@@ -7,7 +7,8 @@ This module provides a comprehensive, async client for interacting with the Cozi
 import asyncio
 import logging
 from datetime import datetime, date, time
-from typing import List, Optional, Dict, Any, Union
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from urllib.parse import urljoin
 
 import aiohttp
@@ -56,16 +57,31 @@ class CoziClient:
         session: Optional[aiohttp.ClientSession] = None,
         retry_attempts: int = 3,
         request_timeout: int = 30,
+        debug_hook: Optional[Callable[[Dict[str, Any], Any], None]] = None,
+        max_connections: int = 20,
+        keepalive_timeout: float = 75.0,
     ):
         """
         Initialize the Cozi client.
-        
+
         Args:
             username: Cozi account username/email
             password: Cozi account password
             session: Optional aiohttp session to use
             retry_attempts: Number of retry attempts for failed requests
             request_timeout: Request timeout in seconds
+            max_connections: Connection-pool size for the client-owned
+                             session; raise it when fanning many requests
+                             out concurrently so they don't queue on the
+                             pool. Ignored when a session is passed in.
+            keepalive_timeout: Seconds an idle pooled connection is kept
+                               open for reuse. Ignored when a session is
+                               passed in.
+            debug_hook: Optional callable invoked as hook(request, response)
+                        after each request. Unlike the last-request/response
+                        accessors, which share one slot per client, the hook
+                        sees every exchange even with calls in flight
+                        concurrently.
         """
         self.username = username
         self.password = password
@@ -73,6 +89,9 @@ class CoziClient:
         self._own_session = session is None
         self.retry_attempts = retry_attempts
         self.request_timeout = request_timeout
+        self.debug_hook = debug_hook
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
         
         # Authentication state
         self._access_token: Optional[str] = None
@@ -83,6 +102,11 @@ class CoziClient:
         # Rate limiting
         self._last_request_time = 0.0
         self._min_request_interval = 0.1  # Minimum time between requests
+
+        # Family member cache (the list rarely changes between calls)
+        self._family_cache: Optional[tuple] = None  # (monotonic timestamp, members)
+        self._family_ttl = 300.0  # Seconds before the cached list goes stale
+        self._family_by_id: Dict[str, CoziPerson] = {}
         
         # Debug information
         self._last_request_data: Optional[Dict[str, Any]] = None
@@ -101,8 +125,16 @@ class CoziClient:
         """Ensure we have a valid aiohttp session."""
         if not self._session:
             timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            # One pooled session for the life of the client: keep-alive
+            # connections avoid paying a TCP+TLS handshake on every request.
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ttl_dns_cache=300,
+                keepalive_timeout=self.keepalive_timeout,
+            )
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
+                connector=connector,
                 cookie_jar=aiohttp.CookieJar()
             )
     
@@ -118,9 +150,27 @@ class CoziClient:
             return {}
         return {"Authorization": f"Bearer {self._access_token}"}
     
-    def get_last_request_data(self) -> Optional[Dict[str, Any]]:
-        """Get the last API request data for debugging."""
-        return self._last_request_data
+    def get_last_request_data(self, redact: Sequence[str] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Get the last API request data for debugging.
+
+        Args:
+            redact: Body keys to replace with '[HIDDEN]' in the returned copy,
+                    e.g. redact=('password',). When nothing needs redacting the
+                    stored dict is returned as-is without copying.
+        """
+        request_data = self._last_request_data
+        if not request_data or not redact:
+            return request_data
+
+        body = request_data.get("data")
+        if not body:
+            return request_data
+
+        hidden = {key: "[HIDDEN]" for key in redact if key in body}
+        if not hidden:
+            return request_data
+        return {**request_data, "data": {**body, **hidden}}
     
     def get_last_response_data(self) -> Optional[Dict[str, Any]]:
         """Get the last API response data for debugging."""
@@ -158,9 +208,9 @@ class CoziClient:
         await self._ensure_session()
         
         if require_auth and not self._authenticated:
-            logger.debug(f"Not authenticated, calling authenticate(). Current account_id: {self._account_id}")
+            logger.debug("Not authenticated, calling authenticate(). Current account_id: %s", self._account_id)
             await self.authenticate()
-            logger.debug(f"After authenticate(). New account_id: {self._account_id}")
+            logger.debug("After authenticate(). New account_id: %s", self._account_id)
         
         # Rate limiting
         now = asyncio.get_event_loop().time()
@@ -170,16 +220,17 @@ class CoziClient:
         
         url = urljoin(self.BASE_URL, endpoint)
         headers = self._get_auth_headers() if require_auth else {}
-        logger.debug(f"Making request to: {url} (account_id: {self._account_id})")
+        logger.debug("Making request to: %s (account_id: %s)", url, self._account_id)
         
         # Store request data for debugging (excluding sensitive auth headers)
-        self._last_request_data = {
+        request_data = {
             "method": method,
             "url": url,
             "data": data,
             "params": params,
         }
-        
+        self._last_request_data = request_data
+
         for attempt in range(self.retry_attempts):
             try:
                 self._last_request_time = asyncio.get_event_loop().time()
@@ -195,13 +246,17 @@ class CoziClient:
                     if response.status in (200, 201):
                         response_data = await response.json()
                         self._last_response_data = response_data
-                        logger.debug(f"API request successful: {method} {endpoint} (status: {response.status})")
+                        if self.debug_hook:
+                            self.debug_hook(request_data, response_data)
+                        logger.debug("API request successful: %s %s (status: %s)", method, endpoint, response.status)
                         return response_data
-                    
+
                     # Handle successful responses with no content (204)
                     elif response.status == 204:
                         self._last_response_data = None
-                        logger.debug(f"API request successful: {method} {endpoint} (status: {response.status}, no content)")
+                        if self.debug_hook:
+                            self.debug_hook(request_data, None)
+                        logger.debug("API request successful: %s %s (status: %s, no content)", method, endpoint, response.status)
                         return True  # Return True to indicate successful operation
                     
                     # Handle error responses - parse JSON for all error cases
@@ -244,7 +299,7 @@ class CoziClient:
                             if attempt < self.retry_attempts - 1:
                                 # Exponential backoff for rate limiting
                                 wait_time = (2 ** attempt) * 1.0
-                                logger.warning(f"Rate limited, waiting {wait_time}s")
+                                logger.warning("Rate limited, waiting %ss", wait_time)
                                 await asyncio.sleep(wait_time)
                                 continue
                             else:
@@ -263,7 +318,7 @@ class CoziClient:
             except aiohttp.ClientError as e:
                 if attempt < self.retry_attempts - 1:
                     wait_time = (2 ** attempt) * 0.5
-                    logger.warning(f"Network error, retrying in {wait_time}s: {e}")
+                    logger.warning("Network error, retrying in %ss: %s", wait_time, e)
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -291,13 +346,13 @@ class CoziClient:
             require_auth=False
         )
         
-        logger.debug(f"Authentication response: {response}")
+        logger.debug("Authentication response: %s", response)
         
         self._access_token = response.get("accessToken")
         self._token_expires = response.get("expiresIn")
         self._account_id = response.get("accountId")
         
-        logger.debug(f"Parsed auth data - token: {self._access_token is not None}, account_id: {self._account_id}")
+        logger.debug("Parsed auth data - token: %s, account_id: %s", self._access_token is not None, self._account_id)
         
         if not all([self._access_token, self._account_id]):
             raise AuthenticationError(f"Invalid login response format. Response: {response}")
@@ -307,38 +362,102 @@ class CoziClient:
     
     # Account and Person Management
     
-    async def get_family_members(self) -> List[CoziPerson]:
+    async def get_family_members(self, refresh: bool = False) -> List[CoziPerson]:
         """
         Get all family members/persons in the account.
-        
+
+        The result is cached for a short TTL since the family roster rarely
+        changes; pass refresh=True to bypass the cache and re-fetch.
+
+        Args:
+            refresh: Force a fresh API fetch even if a cached list is available
+
         Returns:
             List of CoziPerson objects
         """
+        if not refresh and self._family_cache is not None:
+            cached_at, members = self._family_cache
+            if monotonic() - cached_at < self._family_ttl:
+                return members
+
         await self._ensure_authenticated()
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/account/person/"
         response = await self._make_request("GET", endpoint)
-        
+
         if isinstance(response, list):
-            return [CoziPerson.model_validate(person) for person in response]
+            members = [CoziPerson.model_validate(person) for person in response]
+            self._family_cache = (monotonic(), members)
+            self._family_by_id = {member.id: member for member in members if member.id}
+            return members
         return []
+
+    def get_family_member(self, person_id: str) -> Optional[CoziPerson]:
+        """
+        Look up a cached family member by ID without a list scan.
+
+        Only consults the cache populated by get_family_members(); returns
+        None when the person is unknown or the roster has not been fetched.
+
+        Args:
+            person_id: The accountPersonId to resolve
+
+        Returns:
+            The matching CoziPerson, or None
+        """
+        return self._family_by_id.get(person_id)
     
     # List Management
     
-    async def get_lists(self) -> List[CoziList]:
+    async def get_lists(self, return_raw: bool = False) -> Union[List[CoziList], tuple]:
         """
         Get all lists (shopping and todo lists).
-        
+
+        Args:
+            return_raw: When True, return a (lists, raw_json) tuple so
+                callers can inspect the raw response without touching the
+                shared last-response slot (which races under concurrency)
+
         Returns:
-            List of CoziList objects
+            List of CoziList objects, or (lists, raw_json) if return_raw
         """
         await self._ensure_authenticated()
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/"
         response = await self._make_request("GET", endpoint)
-        
-        if isinstance(response, list):
-            return [CoziList.model_validate(list_data) for list_data in response]
-        return []
+
+        if not isinstance(response, list):
+            response = []
+        lists = [CoziList.model_validate(list_data) for list_data in response]
+        if return_raw:
+            return lists, response
+        return lists
     
+    async def iter_lists(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None):
+        """
+        Iterate lists lazily, filtering before model construction.
+
+        The predicate sees each raw list dict; only matching entries are
+        validated into CoziList models, so a membership test over a large
+        account skips Pydantic construction for every non-matching list.
+        (The body is still decoded in full - the API offers no streaming
+        interface - so the savings are model-building CPU and retained
+        objects, not download size.)
+
+        Args:
+            predicate: Optional filter over each raw list dict
+
+        Yields:
+            CoziList objects for entries the predicate accepts
+        """
+        await self._ensure_authenticated()
+        endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/"
+        response = await self._make_request("GET", endpoint)
+
+        if not isinstance(response, list):
+            return
+        for list_data in response:
+            if predicate is None or predicate(list_data):
+                yield CoziList.model_validate(list_data)
+
     async def get_lists_by_type(self, list_type: ListType) -> List[CoziList]:
         """
         Get lists filtered by type.
@@ -352,20 +471,21 @@ class CoziClient:
         all_lists = await self.get_lists()
         return [lst for lst in all_lists if lst.list_type == list_type]
     
-    async def create_list(self, title: str, list_type: ListType) -> CoziList:
+    async def create_list(self, title: str, list_type: ListType, return_raw: bool = False) -> Union[CoziList, tuple]:
         """
         Create a new list.
-        
+
         Args:
             title: List title
             list_type: Type of list to create
-        
+            return_raw: When True, return a (list, raw_json) tuple
+
         Returns:
-            Created CoziList object
+            Created CoziList object, or (list, raw_json) if return_raw
         """
         if not title.strip():
             raise ValidationError("List title cannot be empty")
-        
+
         await self._ensure_authenticated()
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/"
         response = await self._make_request(
@@ -373,8 +493,11 @@ class CoziClient:
             endpoint,
             data={"title": title, "listType": list_type.value}
         )
-        
-        return CoziList.model_validate(response)
+
+        cozi_list = CoziList.model_validate(response)
+        if return_raw:
+            return cozi_list, response
+        return cozi_list
     
     async def update_list(self, list_obj: CoziList) -> CoziList:
         """
@@ -433,24 +556,51 @@ class CoziClient:
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/{list_id}"
         await self._make_request("DELETE", endpoint)
         return True
-    
+
+    async def batch_delete_lists(self, list_ids: Sequence[str], return_remaining: bool = True) -> tuple:
+        """
+        Delete several lists and fetch the remaining collection in one call.
+
+        The Cozi API has no server-side batch-delete endpoint, so the
+        deletes fan out client-side over the shared session; the
+        verification fetch is folded into the same call, costing one
+        delete round trip plus one GET instead of N+1 serialized calls.
+
+        Args:
+            list_ids: IDs of the lists to delete
+            return_remaining: When False, skip the follow-up get_lists
+                and return None for the remaining collection
+
+        Returns:
+            Tuple of (results, remaining): results holds True or the
+            raised exception per id in input order; remaining is the
+            post-delete list collection (or None)
+        """
+        results = await asyncio.gather(
+            *(self.delete_list(list_id) for list_id in list_ids),
+            return_exceptions=True,
+        )
+        remaining = await self.get_lists() if return_remaining else None
+        return results, remaining
+
     # Item Management
     
-    async def add_item(self, list_id: str, text: str, position: int = 0) -> CoziItem:
+    async def add_item(self, list_id: str, text: str, position: int = 0, return_raw: bool = False) -> Union[CoziItem, tuple]:
         """
         Add an item to a list.
-        
+
         Args:
             list_id: ID of the list to add item to
             text: Item text
             position: Position in the list (0 = top)
-        
+            return_raw: When True, return a (item, raw_json) tuple
+
         Returns:
-            Created CoziItem object
+            Created CoziItem object, or (item, raw_json) if return_raw
         """
         if not text.strip():
             raise ValidationError("Item text cannot be empty")
-        
+
         await self._ensure_authenticated()
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/{list_id}/item/"
         response = await self._make_request(
@@ -458,47 +608,58 @@ class CoziClient:
             endpoint,
             data={"text": text, "position": position}
         )
-        
-        return CoziItem.model_validate(response)
+
+        item = CoziItem.model_validate(response)
+        if return_raw:
+            return item, response
+        return item
     
-    async def update_item_text(self, list_id: str, item_id: str, text: str) -> CoziItem:
+    async def update_item_text(self, list_id: str, item_id: str, text: str, return_raw: bool = False) -> Union[CoziItem, tuple]:
         """
         Update the text of a list item.
-        
+
         Args:
             list_id: ID of the list containing the item
             item_id: ID of the item to update
             text: New item text
-        
+            return_raw: When True, return a (item, raw_json) tuple
+
         Returns:
-            Updated CoziItem object
+            Updated CoziItem object, or (item, raw_json) if return_raw
         """
         if not text.strip():
             raise ValidationError("Item text cannot be empty")
-        
+
         await self._ensure_authenticated()
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/{list_id}/item/{item_id}"
         response = await self._make_request("PUT", endpoint, data={"text": text})
-        
-        return CoziItem.model_validate(response)
-    
-    async def mark_item(self, list_id: str, item_id: str, status: ItemStatus) -> CoziItem:
+
+        item = CoziItem.model_validate(response)
+        if return_raw:
+            return item, response
+        return item
+
+    async def mark_item(self, list_id: str, item_id: str, status: ItemStatus, return_raw: bool = False) -> Union[CoziItem, tuple]:
         """
         Mark an item as complete or incomplete.
-        
+
         Args:
             list_id: ID of the list containing the item
             item_id: ID of the item to update
             status: New status for the item
-        
+            return_raw: When True, return a (item, raw_json) tuple
+
         Returns:
-            Updated CoziItem object
+            Updated CoziItem object, or (item, raw_json) if return_raw
         """
         await self._ensure_authenticated()
         endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/list/{list_id}/item/{item_id}"
         response = await self._make_request("PUT", endpoint, data={"status": status.value})
-        
-        return CoziItem.model_validate(response)
+
+        item = CoziItem.model_validate(response)
+        if return_raw:
+            return item, response
+        return item
     
     async def remove_items(self, list_id: str, item_ids: List[str]) -> bool:
         """
@@ -552,13 +713,13 @@ class CoziClient:
                     if appointment:
                         appointments.append(appointment)
                 except Exception as e:
-                    logger.warning(f"Failed to parse appointment {item_id}: {e}")
+                    logger.warning("Failed to parse appointment %s: %s", item_id, e)
         elif isinstance(response, list):
             for appt_data in response:
                 try:
                     appointments.append(CoziAppointment.model_validate(appt_data))
                 except Exception as e:
-                    logger.warning(f"Failed to parse appointment: {e}")
+                    logger.warning("Failed to parse appointment: %s", e)
         
         return appointments
     
@@ -574,7 +735,7 @@ class CoziClient:
             try:
                 start_day = datetime.strptime(day_str, '%Y-%m-%d').date()
             except (ValueError, TypeError):
-                logger.warning(f"Invalid date format: {day_str}")
+                logger.warning("Invalid date format: %s", day_str)
                 return None
             
             # Parse times
@@ -587,7 +748,7 @@ class CoziClient:
                     hour, minute, second = map(int, start_time_str.split(':'))
                     start_time = time(hour=hour, minute=minute)
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid start time format: {start_time_str}")
+                    logger.warning("Invalid start time format: %s", start_time_str)
             
             end_time_str = item_data.get('endTime')
             if end_time_str and end_time_str != '00:00:00':
@@ -595,7 +756,7 @@ class CoziClient:
                     hour, minute, second = map(int, end_time_str.split(':'))
                     end_time = time(hour=hour, minute=minute)
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid end time format: {end_time_str}")
+                    logger.warning("Invalid end time format: %s", end_time_str)
             
             # Extract other details
             location = None
@@ -619,7 +780,7 @@ class CoziClient:
             return CoziAppointment.model_validate(appointment_data)
             
         except Exception as e:
-            logger.error(f"Error parsing calendar item: {e}")
+            logger.error("Error parsing calendar item: %s", e)
             return None
     
     async def create_appointment(self, appointment: CoziAppointment) -> CoziAppointment:
@@ -646,7 +807,7 @@ class CoziClient:
             data=[appointment.to_api_create_format()]
         )
         
-        logger.debug(f"Create appointment response: {response}")
+        logger.debug("Create appointment response: %s", response)
         
         # Handle the complex calendar response format
         if isinstance(response, dict):
@@ -659,18 +820,18 @@ class CoziClient:
                 if (item_data.get('day') == target_date_str and 
                     item_data.get('description') == appointment.subject):
                     appointment.id = item_id
-                    logger.info(f"Found created appointment with ID: {item_id}")
+                    logger.info("Found created appointment with ID: %s", item_id)
                     return appointment
             
             # If not found by date match, try to find the most recently created item with our subject
             for item_id, item_data in items.items():
                 if item_data.get('description') == appointment.subject:
                     appointment.id = item_id
-                    logger.info(f"Found created appointment by subject match with ID: {item_id}")
+                    logger.info("Found created appointment by subject match with ID: %s", item_id)
                     return appointment
         
         # If no ID found, log the response for debugging
-        logger.warning(f"Could not find created appointment ID in response. Response keys: {list(response.keys()) if isinstance(response, dict) else 'Not a dict'}")
+        logger.warning("Could not find created appointment ID in response. Response keys: %s", list(response.keys()) if isinstance(response, dict) else 'Not a dict')
         return appointment
     
     async def update_appointment(self, appointment: CoziAppointment) -> CoziAppointment:
@@ -697,11 +858,43 @@ class CoziClient:
             data=[appointment.to_api_edit_format()]
         )
         
-        logger.debug(f"Update appointment response: {response}")
+        logger.debug("Update appointment response: %s", response)
         
         # Return the updated appointment (API may not return detailed response)
         return appointment
     
+    async def batch_calendar_operations(
+        self,
+        year: int,
+        month: int,
+        operations: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Submit multiple calendar operations in a single HTTP request.
+
+        The Cozi calendar endpoint accepts a JSON array of operation objects,
+        so independent create/edit/delete operations (as produced by
+        CoziAppointment.to_api_create_format(), to_api_edit_format() and
+        to_api_delete_format()) can be combined into one POST instead of
+        paying a round-trip per mutation.
+
+        Args:
+            year: Year the operations apply to
+            month: Month the operations apply to (1-12)
+            operations: List of operation dicts in the calendar API format
+
+        Returns:
+            The combined month response returned by the API
+        """
+        if not (1 <= month <= 12):
+            raise ValidationError("Month must be between 1 and 12")
+        if not operations:
+            raise ValidationError("No calendar operations provided")
+
+        await self._ensure_authenticated()
+        endpoint = f"/api/ext/{self.API_VERSION}/{self._account_id}/calendar/{year}/{month}"
+        return await self._make_request("POST", endpoint, data=operations)
+
     async def delete_appointment(self, appointment_id: str, year: int, month: int) -> bool:
         """
         Delete a calendar appointment.
@@ -2,7 +2,7 @@
 Data models for the Cozi API client.
 """
 
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, Field, PrivateAttr, validator, root_validator
 from datetime import datetime, date, time
 from enum import Enum
 from typing import List, Optional, Dict, Any
@@ -160,7 +160,11 @@ class CoziAppointment(BaseModel):
     birth_year: Optional[int] = Field(None, alias='birthYear')
     created_at: Optional[datetime] = Field(None, alias='createdAt')
     updated_at: Optional[datetime] = Field(None, alias='updatedAt')
-    
+
+    # Memoized API payloads; rebuilt lazily after any field assignment
+    _api_create_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _api_edit_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     class Config:
         populate_by_name = True
         use_enum_values = True
@@ -215,50 +219,61 @@ class CoziAppointment(BaseModel):
             
         return values
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            # Field changes invalidate the memoized API payloads
+            super().__setattr__('_api_create_cache', None)
+            super().__setattr__('_api_edit_cache', None)
+
     @property
     def start_date(self) -> date:
         """Alias for start_day for compatibility."""
         return self.start_day
-    
+
     def to_api_create_format(self) -> Dict[str, Any]:
-        """Convert to API format for creating appointments."""
-        return {
-            "itemType": "appointment",
-            "create": {
-                "startDay": self.start_day.isoformat(),
-                "details": {
-                    "startTime": self.start_time.strftime("%H:%M") if self.start_time else None,
-                    "endTime": self.end_time.strftime("%H:%M") if self.end_time else None,
-                    "dateSpan": self.date_span,
-                    "attendeeSet": self.attendees,
-                    "location": self.location,
-                    "notes": self.notes,
-                    "subject": self.subject,
+        """Convert to API format for creating appointments (memoized)."""
+        if self._api_create_cache is None:
+            self._api_create_cache = {
+                "itemType": "appointment",
+                "create": {
+                    "startDay": self.start_day.isoformat(),
+                    "details": {
+                        "startTime": self.start_time.strftime("%H:%M") if self.start_time else None,
+                        "endTime": self.end_time.strftime("%H:%M") if self.end_time else None,
+                        "dateSpan": self.date_span,
+                        "attendeeSet": self.attendees,
+                        "location": self.location,
+                        "notes": self.notes,
+                        "subject": self.subject,
+                    }
                 }
             }
-        }
-    
+        return self._api_create_cache
+
     def to_api_edit_format(self) -> Dict[str, Any]:
-        """Convert to API format for editing appointments."""
+        """Convert to API format for editing appointments (memoized)."""
         if not self.id:
             raise ValueError("Cannot edit appointment without ID")
-        
-        return {
-            "itemType": "appointment",
-            "edit": {
-                "id": self.id,
-                "startDay": self.start_day.isoformat(),
-                "details": {
-                    "startTime": self.start_time.strftime("%H:%M") if self.start_time else None,
-                    "endTime": self.end_time.strftime("%H:%M") if self.end_time else None,
-                    "dateSpan": self.date_span,
-                    "attendeeSet": self.attendees,
-                    "subject": self.subject,
-                    "location": self.location,
-                    "notes": self.notes,
+
+        if self._api_edit_cache is None:
+            self._api_edit_cache = {
+                "itemType": "appointment",
+                "edit": {
+                    "id": self.id,
+                    "startDay": self.start_day.isoformat(),
+                    "details": {
+                        "startTime": self.start_time.strftime("%H:%M") if self.start_time else None,
+                        "endTime": self.end_time.strftime("%H:%M") if self.end_time else None,
+                        "dateSpan": self.date_span,
+                        "attendeeSet": self.attendees,
+                        "subject": self.subject,
+                        "location": self.location,
+                        "notes": self.notes,
+                    }
                 }
             }
-        }
+        return self._api_edit_cache
     
     def to_api_delete_format(self) -> Dict[str, Any]:
         """Convert appointment to API delete format."""